@@ -0,0 +1,82 @@
+import timeit
+from datetime import date
+from dateutil.relativedelta import relativedelta
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+
+from core_app.models import Customer, Loan
+from core_app.renderers import render_lean_json, orjson
+from core_app.serializers import (
+    LoanDetailSerializer, CustomerLoansSerializer, LEAN_FLOAT_FIELDS, lean_loan_detail, lean_customer_loans
+)
+
+class Command(BaseCommand):
+    help = "Benchmarks the DRF serializer path against the lean read path for /view-loan and /view-loans."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--loans', type=int, nargs='+', default=[1, 1000], help="Loan counts to benchmark.")
+        parser.add_argument('--repeat', type=int, default=5, help="Timing repeats (best is reported).")
+
+    def handle(self, *args, **options):
+        self.stdout.write(f"orjson available: {orjson is not None}")
+        for count in options['loans']:
+            customer, loans = self._build_loans(count)
+            detail_rows = [self._detail_row(loan, customer) for loan in loans]
+            list_rows = [self._list_row(loan) for loan in loans]
+
+            # /view-loan/<id>: one loan per request
+            drf_detail = lambda: [JSONRenderer().render(LoanDetailSerializer(loan).data) for loan in loans]
+            lean_detail = lambda: [render_lean_json(lean_loan_detail(row), LEAN_FLOAT_FIELDS) for row in detail_rows]
+            if drf_detail() != lean_detail():
+                raise CommandError(f"/view-loan output differs for {count} loans.")
+            self._report(f"view-loan x{count}", drf_detail, lean_detail, options['repeat'], max(1, 1000 // count))
+
+            # /view-loans/<customer_id>: all loans in one response
+            drf_list = lambda: JSONRenderer().render(CustomerLoansSerializer(loans, many=True).data)
+            lean_list = lambda: render_lean_json(lean_customer_loans(list_rows), LEAN_FLOAT_FIELDS)
+            if drf_list() != lean_list():
+                raise CommandError(f"/view-loans output differs for {count} loans.")
+            self._report(f"view-loans ({count} loans)", drf_list, lean_list, options['repeat'], max(1, 1000 // count))
+
+    def _report(self, label, drf, lean, repeat, number):
+        drf_time = min(timeit.repeat(drf, number=number, repeat=repeat)) / number
+        lean_time = min(timeit.repeat(lean, number=number, repeat=repeat)) / number
+        self.stdout.write(
+            f"{label:<28} drf={drf_time * 1e3:9.3f} ms  lean={lean_time * 1e3:9.3f} ms  "
+            f"speedup={drf_time / lean_time:5.1f}x"
+        )
+
+    def _build_loans(self, count):
+        """Unsaved instances, so the benchmark measures serialization only (no DB required)."""
+        customer = Customer(
+            id=1, first_name="Asha", last_name="Verma", phone_number="9876543210",
+            monthly_salary=100000, age=30, approved_limit=3600000,
+        )
+        today = date.today()
+        loans = []
+        for i in range(count):
+            tenure = 12 + (i % 49)
+            start_date = today - relativedelta(months=i % tenure)
+            loans.append(Loan(
+                id=i + 1, customer=customer, loan_amount=100000.0 + i * 250.5, tenure=tenure,
+                interest_rate=8.0 + (i % 900) / 100, monthly_installment=round(9000.0 + i * 1.37, 2),
+                emis_paid_on_time=i % tenure, start_date=start_date,
+                end_date=start_date + relativedelta(months=tenure), is_current=True,
+            ))
+        return customer, loans
+
+    def _detail_row(self, loan, customer):
+        return {
+            'id': loan.id, 'loan_amount': loan.loan_amount, 'interest_rate': loan.interest_rate,
+            'monthly_installment': loan.monthly_installment, 'tenure': loan.tenure,
+            'customer__id': customer.id, 'customer__first_name': customer.first_name,
+            'customer__last_name': customer.last_name, 'customer__phone_number': customer.phone_number,
+            'customer__age': customer.age,
+        }
+
+    def _list_row(self, loan):
+        return {
+            'id': loan.id, 'loan_amount': loan.loan_amount, 'interest_rate': loan.interest_rate,
+            'monthly_installment': loan.monthly_installment, 'is_current': loan.is_current,
+            'start_date': loan.start_date, 'tenure': loan.tenure,
+        }
@@ -2,6 +2,20 @@ from django.db import models
 from datetime import date
 from dateutil.relativedelta import relativedelta
 
+def calculate_repayments_left(is_current: bool, start_date: date, tenure: int, today: date = None) -> int:
+    """Remaining EMIs for a loan, based on today's date vs its start date and tenure."""
+    if not is_current:
+        return 0
+    today = today or date.today()
+    elapsed = relativedelta(today, start_date)
+    months_passed = elapsed.years * 12 + elapsed.months
+
+    # Ensure we don't return a negative or more than the loan tenure
+    if months_passed >= tenure:
+        return 0
+
+    return tenure - months_passed
+
 # Helper for initial data ingestion (not explicitly asked for, but useful)
 class InitialDataIngestion(models.Model):
     is_customer_data_ingested = models.BooleanField(default=False)
@@ -23,6 +37,9 @@ class Customer(models.Model):
     total_monthly_emi = models.FloatField(default=0)
     credit_score = models.IntegerField(default=0) 
 
+    # Bumped whenever loans or debt change; keys memoized per-customer results (e.g. /quote-matrix)
+    state_version = models.IntegerField(default=0)
+
     def __str__(self):
         return f"{self.first_name} {self.last_name} (ID: {self.id})"
 
@@ -48,13 +65,4 @@ class Loan(models.Model):
 
     @property
     def repayments_left(self):
-        if not self.is_current:
-             return 0
-        # Calculate remaining EMIs based on today's date vs start/end date
-        months_passed = relativedelta(date.today(), self.start_date).years * 12 + relativedelta(date.today(), self.start_date).months
-        
-        # Ensure we don't return a negative or more than the loan tenure
-        if months_passed >= self.tenure:
-            return 0
-            
-        return self.tenure - months_passed
\ No newline at end of file
+        return calculate_repayments_left(self.is_current, self.start_date, self.tenure)
\ No newline at end of file
@@ -0,0 +1,44 @@
+from django.conf import settings
+from django.http import HttpResponse
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:
+    # Without orjson the lean path still skips the serializers, it just renders with DRF's encoder
+    orjson = None
+
+# orjson only formats floats differently from the stdlib encoder outside this range
+# (1e16 vs 1e+16, 0.000015 vs 1.5e-05) and for NaN/Infinity, so those fall back to JSONRenderer.
+ORJSON_FLOAT_MIN = 1e-4
+ORJSON_FLOAT_MAX = 1e16
+
+def _renders_identically(value: float) -> bool:
+    return value == 0 or ORJSON_FLOAT_MIN <= abs(value) < ORJSON_FLOAT_MAX
+
+def use_lean_read_path(request) -> bool:
+    """True if the lean read path is enabled and the client negotiated plain (non-indented) JSON."""
+    return (
+        settings.LEAN_READ_SERIALIZATION
+        and type(request.accepted_renderer) is JSONRenderer
+        and 'indent' not in (request.accepted_media_type or '')
+    )
+
+def render_lean_json(data, float_fields=()) -> bytes:
+    """Renders data to exactly the bytes JSONRenderer would, using orjson where that is safe."""
+    renderer = JSONRenderer()
+    records = data if isinstance(data, list) else [data]
+
+    if (
+        orjson is None
+        or not renderer.compact
+        or renderer.ensure_ascii
+        or not all(_renders_identically(record[field]) for record in records for field in float_fields)
+    ):
+        return renderer.render(data)
+
+    # Match JSONRenderer's escaping of U+2028 / U+2029
+    return orjson.dumps(data).replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+
+def lean_json_response(data, float_fields=(), status=200) -> HttpResponse:
+    return HttpResponse(render_lean_json(data, float_fields), content_type='application/json', status=status)
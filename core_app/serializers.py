@@ -1,13 +1,17 @@
 from rest_framework import serializers
-from .models import Customer, Loan
+from datetime import date
+from .models import Customer, Loan, calculate_repayments_left
 
 # --- 1. /register ---
 
+# Largest income whose approved_limit (36x, rounded to the lakh) still fits the int4 IntegerField
+MAX_MONTHLY_INCOME = 59651388
+
 class CustomerRegisterSerializer(serializers.Serializer):
     first_name = serializers.CharField(max_length=100)
     last_name = serializers.CharField(max_length=100)
     age = serializers.IntegerField(min_value=1)
-    monthly_income = serializers.IntegerField(min_value=0)
+    monthly_income = serializers.IntegerField(min_value=0, max_value=MAX_MONTHLY_INCOME)
     phone_number = serializers.CharField(max_length=15)
 
 class CustomerResponseSerializer(serializers.ModelSerializer):
@@ -55,7 +59,7 @@ class CreateLoanResponseSerializer(serializers.Serializer):
 
 class CustomerMiniSerializer(serializers.ModelSerializer):
     """Nested serializer for customer details in /view-loan."""
-    full_name = serializers.CharField(source='full_name', read_only=True)
+    full_name = serializers.CharField(read_only=True)
     class Meta:
         model = Customer
         fields = ('id', 'first_name', 'last_name', 'phone_number', 'age', 'full_name')
@@ -76,4 +80,64 @@ class CustomerLoansSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = Loan
-        fields = ('id', 'loan_amount', 'interest_rate', 'monthly_installment', 'repayments_left')
\ No newline at end of file
+        fields = ('id', 'loan_amount', 'interest_rate', 'monthly_installment', 'repayments_left')
+
+# --- 7. /quote-matrix/customer_id (Query Params) ---
+
+class QuoteMatrixRequestSerializer(serializers.Serializer):
+    # Bounded so (1 + r) ** tenure stays finite for every allowed tenure
+    interest_rate = serializers.FloatField(min_value=0.01, max_value=100)
+    tenures = serializers.ListField(
+        child=serializers.IntegerField(min_value=1, max_value=600), default=list(range(6, 61, 6)), max_length=60
+    )
+    amount_step = serializers.IntegerField(min_value=1000, default=50000)
+    max_amount = serializers.IntegerField(min_value=1000, required=False)
+
+# --- 8. Lean read path (/view-loan, /view-loans) ---
+# Plain-dict equivalents of LoanDetailSerializer and CustomerLoansSerializer, built from .values() rows.
+# Key order and value types must stay identical to the serializers above.
+
+LEAN_FLOAT_FIELDS = ('loan_amount', 'interest_rate', 'monthly_installment')
+
+LEAN_LOAN_DETAIL_FIELDS = (
+    'id', 'loan_amount', 'interest_rate', 'monthly_installment', 'tenure',
+    'customer__id', 'customer__first_name', 'customer__last_name', 'customer__phone_number', 'customer__age',
+)
+
+LEAN_CUSTOMER_LOANS_FIELDS = (
+    'id', 'loan_amount', 'interest_rate', 'monthly_installment', 'is_current', 'start_date', 'tenure',
+)
+
+def lean_loan_detail(row: dict) -> dict:
+    """Same output as LoanDetailSerializer, from a row with LEAN_LOAN_DETAIL_FIELDS."""
+    first_name = row['customer__first_name']
+    last_name = row['customer__last_name']
+    return {
+        'id': row['id'],
+        'customer': {
+            'id': row['customer__id'],
+            'first_name': first_name,
+            'last_name': last_name,
+            'phone_number': row['customer__phone_number'],
+            'age': row['customer__age'],
+            'full_name': f"{first_name} {last_name}",
+        },
+        'loan_amount': row['loan_amount'],
+        'interest_rate': row['interest_rate'],
+        'monthly_installment': row['monthly_installment'],
+        'tenure': row['tenure'],
+    }
+
+def lean_customer_loans(rows) -> list:
+    """Same output as CustomerLoansSerializer(many=True), from rows with LEAN_CUSTOMER_LOANS_FIELDS."""
+    today = date.today()
+    return [
+        {
+            'id': row['id'],
+            'loan_amount': row['loan_amount'],
+            'interest_rate': row['interest_rate'],
+            'monthly_installment': row['monthly_installment'],
+            'repayments_left': calculate_repayments_left(row['is_current'], row['start_date'], row['tenure'], today),
+        }
+        for row in rows
+    ]
@@ -1,9 +1,12 @@
 import math
+import numpy as np
 from datetime import date
 from dateutil.relativedelta import relativedelta
 from django.db.models import Sum, F
-from django.db import models
+from django.db import models, transaction, DatabaseError, IntegrityError
+from django.core.cache import cache
 from .models import Customer, Loan
+from .serializers import CustomerRegisterSerializer
 
 # --------------------
 # A. Financial Calculations
@@ -47,7 +50,7 @@ def calculate_credit_score(customer_id: int) -> int:
     current_loan_sum = loans.filter(is_current=True).aggregate(Sum('loan_amount'))['loan_amount__sum'] or 0
     if current_loan_sum > customer.approved_limit:
         customer.credit_score = 0
-        customer.save()
+        customer.save(update_fields=['credit_score'])
         return 0 
 
     # i. Past Loans paid on time (if emis_paid_on_time >= tenure for closed loans)
@@ -75,34 +78,14 @@ def calculate_credit_score(customer_id: int) -> int:
     final_score = max(0, min(100, score))
 
     customer.credit_score = final_score
-    customer.save()
+    customer.save(update_fields=['credit_score'])
     return final_score
 
-def check_loan_eligibility(customer: Customer, requested_loan_amount: float, requested_interest_rate: float, tenure: int) -> dict:
-    """Performs all eligibility checks and returns decision and corrected rate."""
-
-    score = customer.credit_score 
-    approval = False
+def apply_interest_rate_slab(score: int, requested_interest_rate: float) -> tuple:
+    """Returns (approval, corrected_interest_rate, message) for the credit score's interest rate slab."""
     corrected_interest_rate = requested_interest_rate
     message = None
-    
-    # 1. Calculate potential EMI and check EMI to salary ratio
-    max_emi_limit = customer.monthly_salary * 0.5
-    potential_emi = calculate_monthly_installment(requested_loan_amount, requested_interest_rate, tenure)
-    total_current_and_new_emi = customer.total_monthly_emi + potential_emi
-    
-    if total_current_and_new_emi > max_emi_limit:
-        return {
-            "customer_id": customer.id,
-            "approval": False,
-            "interest_rate": requested_interest_rate,
-            "corrected_interest_rate": None,
-            "tenure": tenure,
-            "monthly_installment": potential_emi,
-            "message": "Total EMI (including new loan) exceeds 50% of monthly salary, loan rejected."
-        }
 
-    # 2. Determine approval status and required interest rate slab
     if score > 50:
         approval = True
         min_required_rate = 0 
@@ -119,10 +102,36 @@ def check_loan_eligibility(customer: Customer, requested_loan_amount: float, req
         approval = False
         message = "Credit score too low (≤ 10), don't approve any loans."
 
-    # 3. Apply Interest Rate Correction if Approved
+    # Apply Interest Rate Correction if Approved
     if approval and requested_interest_rate < min_required_rate:
         corrected_interest_rate = corrected_rate_slab
+
+    return approval, corrected_interest_rate, message
+
+def check_loan_eligibility(customer: Customer, requested_loan_amount: float, requested_interest_rate: float, tenure: int) -> dict:
+    """Performs all eligibility checks and returns decision and corrected rate."""
+
+    score = customer.credit_score 
     
+    # 1. Calculate potential EMI and check EMI to salary ratio
+    max_emi_limit = customer.monthly_salary * 0.5
+    potential_emi = calculate_monthly_installment(requested_loan_amount, requested_interest_rate, tenure)
+    total_current_and_new_emi = customer.total_monthly_emi + potential_emi
+    
+    if total_current_and_new_emi > max_emi_limit:
+        return {
+            "customer_id": customer.id,
+            "approval": False,
+            "interest_rate": requested_interest_rate,
+            "corrected_interest_rate": None,
+            "tenure": tenure,
+            "monthly_installment": potential_emi,
+            "message": "Total EMI (including new loan) exceeds 50% of monthly salary, loan rejected."
+        }
+
+    # 2. Determine approval status and apply the interest rate slab correction
+    approval, corrected_interest_rate, message = apply_interest_rate_slab(score, requested_interest_rate)
+
     final_monthly_installment = calculate_monthly_installment(
         requested_loan_amount, corrected_interest_rate, tenure
     )
@@ -139,4 +148,187 @@ def check_loan_eligibility(customer: Customer, requested_loan_amount: float, req
     if not approval:
          response['message'] = message
 
-    return response
\ No newline at end of file
+    return response
+
+# --------------------
+# C. Bulk Registration
+# --------------------
+
+BULK_REGISTER_CHUNK_SIZE = 1000
+
+def _duplicate_phone_result(index: int) -> dict:
+    return {
+        "index": index,
+        "created": False,
+        "errors": {"phone_number": ["Customer with this phone number already exists."]},
+    }
+
+def _created_result(index: int, customer: Customer) -> dict:
+    return {
+        "index": index,
+        "created": True,
+        "customer_id": customer.id,
+        "approved_limit": customer.approved_limit,
+    }
+
+def _insert_rows_individually(chunk: list, results: list):
+    """Fallback for a chunk whose bulk insert failed: insert row by row and record each row's outcome."""
+    for index, customer in chunk:
+        try:
+            with transaction.atomic():
+                customer.save(force_insert=True)
+        except IntegrityError as e:
+            # Most likely a concurrent registration took the phone number
+            if Customer.objects.filter(phone_number=customer.phone_number).exists():
+                results[index] = _duplicate_phone_result(index)
+            else:
+                results[index] = {"index": index, "created": False, "errors": {"non_field_errors": [str(e)]}}
+        except DatabaseError as e:
+            results[index] = {"index": index, "created": False, "errors": {"non_field_errors": [str(e)]}}
+        else:
+            results[index] = _created_result(index, customer)
+
+def register_customers_batch(records: list, chunk_size: int = BULK_REGISTER_CHUNK_SIZE) -> list:
+    """
+    Validates and registers a batch of customers.
+    Returns one result per input record (same order), carrying either the new customer's ID or the errors.
+    """
+    results = [None] * len(records)
+    pending = [] # (index, validated_data)
+
+    # 1. Validate every record with the same serializer as /register
+    for index, record in enumerate(records):
+        serializer = CustomerRegisterSerializer(data=record)
+        if serializer.is_valid():
+            pending.append((index, serializer.validated_data))
+        else:
+            results[index] = {"index": index, "created": False, "errors": serializer.errors}
+
+    # 2. Reject phone numbers already registered (single query) or repeated within the batch
+    phone_numbers = {data['phone_number'] for _, data in pending}
+    existing_phones = set(
+        Customer.objects.filter(phone_number__in=phone_numbers).values_list('phone_number', flat=True)
+    )
+
+    to_create = []
+    seen_phones = set()
+    for index, data in pending:
+        phone = data['phone_number']
+        if phone in existing_phones or phone in seen_phones:
+            results[index] = _duplicate_phone_result(index)
+            continue
+        seen_phones.add(phone)
+        to_create.append((index, Customer(
+            first_name=data['first_name'],
+            last_name=data['last_name'],
+            age=data['age'],
+            phone_number=phone,
+            monthly_salary=data['monthly_income'],
+            approved_limit=calculate_approved_limit(data['monthly_income']),
+        )))
+
+    # 3. Insert in chunks; each chunk is its own transaction so one bad row doesn't sink the batch
+    for start in range(0, len(to_create), chunk_size):
+        chunk = to_create[start:start + chunk_size]
+        try:
+            with transaction.atomic():
+                Customer.objects.bulk_create([customer for _, customer in chunk])
+        except DatabaseError:
+            # Concurrent phone conflicts or rows the DB rejects; isolate them so every item gets a result
+            _insert_rows_individually(chunk, results)
+            continue
+
+        for index, customer in chunk:
+            results[index] = _created_result(index, customer)
+
+    return results
+
+# --------------------
+# D. Offer Matrix (/quote-matrix)
+# --------------------
+
+QUOTE_MATRIX_MAX_AMOUNT_STEPS = 500
+# Entries are keyed by state_version, which every loan/debt change bumps atomically in SQL
+QUOTE_MATRIX_CACHE_TIMEOUT = 15 * 60 # seconds
+
+def _installment_grid(amounts: np.ndarray, interest_rate: float, tenures: np.ndarray) -> np.ndarray:
+    """EMIs for every (amount, tenure) pair, using the same arithmetic as calculate_monthly_installment."""
+    monthly_rate = (interest_rate / 12) / 100
+
+    if monthly_rate <= 0:
+        return np.round(amounts[:, None] / tenures[None, :], 2)
+
+    growth = (1 + monthly_rate) ** tenures
+    factors = (monthly_rate * growth) / (growth - 1)
+    return np.round(amounts[:, None] * factors[None, :], 2)
+
+def build_quote_matrix(customer: Customer, interest_rate: float, tenures: list, amounts: list) -> dict:
+    """
+    Evaluates check_loan_eligibility for every (amount, tenure) cell in one vectorized pass.
+    Expects customer.credit_score to be up to date.
+    """
+    approval, corrected_interest_rate, _ = apply_interest_rate_slab(customer.credit_score, interest_rate)
+
+    amount_grid = np.asarray(amounts, dtype=float)
+    tenure_grid = np.asarray(tenures, dtype=float)
+
+    # The 50%-of-salary cap is checked against the EMI at the requested rate, as in check_loan_eligibility
+    requested_emis = _installment_grid(amount_grid, interest_rate, tenure_grid)
+    if corrected_interest_rate == interest_rate:
+        corrected_emis = requested_emis
+    else:
+        corrected_emis = _installment_grid(amount_grid, corrected_interest_rate, tenure_grid)
+
+    within_emi_cap = (customer.total_monthly_emi + requested_emis) <= customer.monthly_salary * 0.5
+    approved = within_emi_cap & approval
+    emis = np.where(within_emi_cap, corrected_emis, requested_emis)
+    max_approvable = np.where(approved, amount_grid[:, None], -np.inf).max(axis=0, initial=-np.inf)
+
+    # Transpose to one row per tenure for the response
+    approved_rows = approved.T.tolist()
+    within_cap_rows = within_emi_cap.T.tolist()
+    emi_rows = emis.T.tolist()
+
+    offers = []
+    for j, tenure in enumerate(tenures):
+        offers.append({
+            "tenure": tenure,
+            "max_approvable_amount": int(max_approvable[j]) if np.isfinite(max_approvable[j]) else None,
+            "cells": [
+                {
+                    "loan_amount": amount,
+                    "approval": approved_rows[j][i],
+                    "corrected_interest_rate": corrected_interest_rate if within_cap_rows[j][i] else None,
+                    "monthly_installment": emi_rows[j][i],
+                }
+                for i, amount in enumerate(amounts)
+            ],
+        })
+
+    return {
+        "customer_id": customer.id,
+        "credit_score": customer.credit_score,
+        "interest_rate": interest_rate,
+        "offers": offers,
+    }
+
+def get_quote_matrix(customer: Customer, interest_rate: float, tenures: list, amount_step: int, max_amount: int = None) -> dict:
+    """
+    Returns the offer matrix, memoized per customer state version.
+    The customer is only re-scored on a cache miss.
+    """
+    max_amount = max_amount or customer.approved_limit
+    amounts = list(range(amount_step, max_amount + 1, amount_step))
+    if len(amounts) > QUOTE_MATRIX_MAX_AMOUNT_STEPS:
+        raise ValueError(f"Amount grid exceeds {QUOTE_MATRIX_MAX_AMOUNT_STEPS} steps, increase amount_step.")
+
+    tenures = sorted(set(tenures))
+    cache_key = "quote-matrix:{}:{}:{}:{}:{}:{}".format(
+        customer.id, customer.state_version, interest_rate, ",".join(map(str, tenures)), amount_step, max_amount
+    )
+    matrix = cache.get(cache_key)
+    if matrix is None:
+        customer.credit_score = calculate_credit_score(customer.id)
+        matrix = build_quote_matrix(customer, interest_rate, tenures, amounts)
+        cache.set(cache_key, matrix, QUOTE_MATRIX_CACHE_TIMEOUT)
+    return matrix
@@ -0,0 +1,67 @@
+from django.test import TestCase
+
+from .models import Customer
+from .services import build_quote_matrix, check_loan_eligibility
+
+class QuoteMatrixParityTests(TestCase):
+    """build_quote_matrix must agree cell-for-cell with check_loan_eligibility."""
+
+    TENURES = list(range(6, 61, 6))
+    AMOUNTS = list(range(50000, 3600001, 50000))
+    RATES = [8.0, 14.0, 17.5]
+    # One score per slab: <= 10, (10, 30], (30, 50], > 50
+    SCORES = [5, 20, 40, 80]
+
+    def setUp(self):
+        self.customer = Customer.objects.create(
+            first_name="Asha", last_name="Verma", phone_number="9876543210",
+            age=30, monthly_salary=100000, approved_limit=3600000,
+        )
+
+    def assert_matches_eligibility(self, customer, interest_rate):
+        matrix = build_quote_matrix(customer, interest_rate, self.TENURES, self.AMOUNTS)
+        decisions = []
+
+        for offer in matrix["offers"]:
+            approved_amounts = []
+            for cell in offer["cells"]:
+                expected = check_loan_eligibility(customer, cell["loan_amount"], interest_rate, offer["tenure"])
+                with self.subTest(score=customer.credit_score, rate=interest_rate,
+                                  tenure=offer["tenure"], amount=cell["loan_amount"]):
+                    self.assertEqual(cell["approval"], expected["approval"])
+                    self.assertEqual(cell["corrected_interest_rate"], expected["corrected_interest_rate"])
+                    self.assertEqual(cell["monthly_installment"], expected["monthly_installment"])
+                if expected["approval"]:
+                    approved_amounts.append(cell["loan_amount"])
+                decisions.append(expected["corrected_interest_rate"] is not None)
+
+            self.assertEqual(offer["max_approvable_amount"], max(approved_amounts, default=None))
+
+        return decisions
+
+    def test_every_credit_score_slab(self):
+        for score in self.SCORES:
+            self.customer.credit_score = score
+            for rate in self.RATES:
+                self.assert_matches_eligibility(self.customer, rate)
+
+    def test_customer_near_emi_cap(self):
+        # 10,000 of EMI headroom, so the 50%-of-salary cap cuts through the grid
+        self.customer.credit_score = 80
+        self.customer.total_monthly_emi = 40000
+
+        for rate in self.RATES:
+            within_cap = self.assert_matches_eligibility(self.customer, rate)
+            self.assertIn(True, within_cap)
+            self.assertIn(False, within_cap)
+
+    def test_cell_exactly_at_emi_cap(self):
+        # An EMI landing exactly on 50% of salary is still within the cap (check_loan_eligibility rejects only '>')
+        self.customer.credit_score = 80
+        emi = check_loan_eligibility(self.customer, 100000, 8.0, 12)["monthly_installment"]
+        self.customer.total_monthly_emi = self.customer.monthly_salary * 0.5 - emi
+        self.assertEqual(self.customer.total_monthly_emi + emi, self.customer.monthly_salary * 0.5)
+
+        self.assert_matches_eligibility(self.customer, 8.0)
+        matrix = build_quote_matrix(self.customer, 8.0, [12], [100000])
+        self.assertTrue(matrix["offers"][0]["cells"][0]["approval"])
@@ -3,8 +3,11 @@ from . import views
 
 urlpatterns = [
     path('register', views.register_customer, name='register_customer'),
+    path('register-batch', views.register_customers_bulk, name='register_customers_bulk'),
+    path('register-batch/<str:task_id>', views.register_customers_bulk_status, name='register_customers_bulk_status'),
     path('check-eligibility', views.check_eligibility, name='check_eligibility'),
     path('create-loan', views.create_loan, name='create_loan'),
     path('view-loan/<int:loan_id>', views.view_loan, name='view_loan'),
     path('view-loans/<int:customer_id>', views.view_loans, name='view_loans'),
+    path('quote-matrix/<int:customer_id>', views.quote_matrix, name='quote_matrix'),
 ]
\ No newline at end of file
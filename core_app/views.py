@@ -2,16 +2,24 @@ from rest_framework.decorators import api_view
 from rest_framework.response import Response
 from rest_framework import status
 from django.db import transaction
+from django.db.models import F
 from dateutil.relativedelta import relativedelta
 from datetime import date
+from celery.result import AsyncResult
 
 from .models import Customer, Loan
 from .serializers import (
     CustomerRegisterSerializer, CustomerResponseSerializer, LoanRequestSerializer,
     EligibilityResponseSerializer, CreateLoanResponseSerializer, LoanDetailSerializer,
-    CustomerLoansSerializer
+    CustomerLoansSerializer, LEAN_FLOAT_FIELDS, LEAN_LOAN_DETAIL_FIELDS, LEAN_CUSTOMER_LOANS_FIELDS,
+    lean_loan_detail, lean_customer_loans, QuoteMatrixRequestSerializer
 )
-from .services import calculate_approved_limit, calculate_credit_score, check_loan_eligibility
+from .renderers import use_lean_read_path, lean_json_response
+from .services import (
+    calculate_approved_limit, calculate_credit_score, check_loan_eligibility, register_customers_batch,
+    get_quote_matrix
+)
+from workers.ingest_data import register_customers_batch_task
 
 # --- 1. /register ---
 @api_view(['POST'])
@@ -42,6 +50,51 @@ def register_customer(request):
         return Response({"message": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+# --- 1b. /register-batch ---
+REGISTER_BATCH_SYNC_LIMIT = 2000
+
+@api_view(['POST'])
+def register_customers_bulk(request):
+    records = request.data.get('customers') if isinstance(request.data, dict) else request.data
+    if not isinstance(records, list) or not records:
+        return Response({"message": "Expected a non-empty list of customers."}, status=status.HTTP_400_BAD_REQUEST)
+
+    # Large partner batches can be handed off to the worker instead of blocking the request
+    if request.query_params.get('async') == 'true':
+        task = register_customers_batch_task.delay(records)
+        return Response({"task_id": task.id, "submitted": len(records)}, status=status.HTTP_202_ACCEPTED)
+
+    if len(records) > REGISTER_BATCH_SYNC_LIMIT:
+        return Response(
+            {"message": f"Batches over {REGISTER_BATCH_SYNC_LIMIT} customers must be submitted with ?async=true."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    results = register_customers_batch(records)
+    created = sum(1 for result in results if result['created'])
+    return Response({
+        "created": created,
+        "failed": len(results) - created,
+        "results": results,
+    }, status=status.HTTP_200_OK)
+
+
+# --- 1c. /register-batch/<task_id> ---
+@api_view(['GET'])
+def register_customers_bulk_status(request, task_id):
+    result = AsyncResult(task_id, app=register_customers_batch_task.app)
+    response_data = {"task_id": task_id, "state": result.state}
+
+    if result.successful():
+        results = result.result
+        created = sum(1 for item in results if item['created'])
+        response_data.update({"created": created, "failed": len(results) - created, "results": results})
+    elif result.failed():
+        response_data["message"] = str(result.result)
+
+    return Response(response_data, status=status.HTTP_200_OK)
+
+
 # --- 2. /check-eligibility ---
 @api_view(['POST'])
 def check_eligibility(request):
@@ -109,7 +162,10 @@ def create_loan(request):
             # Update Customer Debt
             customer.current_debt += data['loan_amount'] # Crude debt update
             customer.total_monthly_emi += monthly_installment
-            customer.save()
+            customer.save(update_fields=['current_debt', 'total_monthly_emi'])
+
+            # Bump in SQL so concurrent loans can't both write the same version
+            Customer.objects.filter(pk=customer.pk).update(state_version=F('state_version') + 1)
             
             response_data = {
                 "loan_id": loan.id,
@@ -135,6 +191,12 @@ def create_loan(request):
 # --- 4. /view-loan/<loan_id> ---
 @api_view(['GET'])
 def view_loan(request, loan_id):
+    if use_lean_read_path(request):
+        row = Loan.objects.filter(pk=loan_id).values(*LEAN_LOAN_DETAIL_FIELDS).first()
+        if row is None:
+            return Response({"message": "Loan not found."}, status=status.HTTP_404_NOT_FOUND)
+        return lean_json_response(lean_loan_detail(row), LEAN_FLOAT_FIELDS)
+
     try:
         loan = Loan.objects.select_related('customer').get(pk=loan_id)
     except Loan.DoesNotExist:
@@ -147,6 +209,12 @@ def view_loan(request, loan_id):
 # --- 5. /view-loans/<customer_id> ---
 @api_view(['GET'])
 def view_loans(request, customer_id):
+    if use_lean_read_path(request):
+        if not Customer.objects.filter(pk=customer_id).exists():
+            return Response({"message": "Customer not found."}, status=status.HTTP_404_NOT_FOUND)
+        rows = Loan.objects.filter(customer_id=customer_id, is_current=True).values(*LEAN_CUSTOMER_LOANS_FIELDS)
+        return lean_json_response(lean_customer_loans(rows), LEAN_FLOAT_FIELDS)
+
     try:
         Customer.objects.get(pk=customer_id)
     except Customer.DoesNotExist:
@@ -155,4 +223,24 @@ def view_loans(request, customer_id):
     loans = Loan.objects.filter(customer_id=customer_id, is_current=True)
     serializer = CustomerLoansSerializer(loans, many=True)
     
-    return Response(serializer.data, status=status.HTTP_200_OK)
\ No newline at end of file
+    return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+# --- 6. /quote-matrix/<customer_id> ---
+@api_view(['GET'])
+def quote_matrix(request, customer_id):
+    request_serializer = QuoteMatrixRequestSerializer(data=request.query_params)
+    if not request_serializer.is_valid():
+        return Response(request_serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        customer = Customer.objects.get(pk=customer_id)
+    except Customer.DoesNotExist:
+        return Response({"message": "Customer not found."}, status=status.HTTP_404_NOT_FOUND)
+
+    try:
+        matrix = get_quote_matrix(customer, **request_serializer.validated_data)
+    except ValueError as e:
+        return Response({"message": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    return Response(matrix, status=status.HTTP_200_OK)
\ No newline at end of file
@@ -82,4 +82,16 @@ CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 
+# Shared cache (e.g. memoized /quote-matrix results); db 1 keeps it apart from the Celery broker
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': f"redis://{os.getenv('REDIS_HOST')}:{os.getenv('REDIS_PORT')}/1",
+    }
+}
+
+# Opt-in fast path for /view-loan and /view-loans: builds responses from .values() rows
+# and renders them with orjson, producing the same bytes as the DRF serializers.
+LEAN_READ_SERIALIZATION = os.getenv('LEAN_READ_SERIALIZATION', 'False') == 'True'
+
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
\ No newline at end of file
@@ -1,10 +1,10 @@
 import pandas as pd
 from datetime import date, datetime
 from celery import shared_task
-from django.db import transaction
+from django.db import transaction, models
 from dateutil.relativedelta import relativedelta
 from core_app.models import Customer, Loan, InitialDataIngestion
-from core_app.services import calculate_approved_limit, calculate_monthly_installment
+from core_app.services import calculate_approved_limit, calculate_monthly_installment, register_customers_batch
 
 @shared_task
 def ingest_initial_data(customer_filepath: str, loan_filepath: str):
@@ -104,6 +104,9 @@ def ingest_initial_data(customer_filepath: str, loan_filepath: str):
 
             with transaction.atomic():
                 Loan.objects.bulk_create(loan_objects, ignore_conflicts=True)
+
+                # Loan history changed for every customer, so invalidate memoized per-customer results
+                Customer.objects.update(state_version=models.F('state_version') + 1)
                 
                 # Update Customer current_debt and total_monthly_emi
                 for cust_id, data in debt_updates.items():
@@ -120,6 +123,17 @@ def ingest_initial_data(customer_filepath: str, loan_filepath: str):
         print(f"An error occurred during data ingestion: {e}")
         # In a real system, you'd log the error and mark the task as failed.
 
+@shared_task
+def register_customers_batch_task(records: list):
+    """
+    Registers a partner batch of customers in the background.
+    Returns the per-record results of register_customers_batch.
+    """
+    results = register_customers_batch(records)
+    created = sum(1 for result in results if result['created'])
+    print(f"Batch registration complete: {created} created, {len(results) - created} failed.")
+    return results
+
 def start_ingestion_if_needed():
     """Starts the ingestion task if the DB is available."""
     try:
@@ -0,0 +1,190 @@
+import os
+import time
+import numpy as np
+import pandas as pd
+from datetime import date, datetime
+from django.core.management.base import BaseCommand, CommandError
+from django.core.management.color import no_style
+from django.db import connection, transaction
+from core_app.models import Customer, Loan, InitialDataIngestion
+from workers.synthetic_data import CUSTOMER_COLUMNS, LOAN_COLUMNS, GenerationConfig, iter_chunks, months_between
+
+XLSX_MAX_ROWS = 1_048_575 # sheet limit minus the header row
+DB_BATCH_SIZE = 5000
+
+class Command(BaseCommand):
+    help = (
+        "Generates deterministic synthetic customer and loan datasets in the ingest_initial_data column layout, "
+        "as CSV/XLSX files or written straight to the database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--customers', type=int, default=300)
+        parser.add_argument('--loans', type=int, default=800)
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--format', choices=['csv', 'xlsx', 'db'], default='csv')
+        parser.add_argument('--output-dir', default='.', help="Directory for customer_data.* and loan_data.*")
+        parser.add_argument('--as-of', type=lambda s: datetime.strptime(s, '%Y-%m-%d').date(), default=date(2025, 1, 1),
+                            help="Reference date for loan history (fixed by default so output is repeatable).")
+        parser.add_argument('--age-range', type=int, nargs=2, default=[20, 70], metavar=('MIN', 'MAX'))
+        parser.add_argument('--salary-median', type=int, default=150000)
+        parser.add_argument('--salary-sigma', type=float, default=0.5, help="Lognormal sigma of monthly salary.")
+        parser.add_argument('--tenure-range', type=int, nargs=2, default=[3, 180], metavar=('MIN', 'MAX'))
+        parser.add_argument('--rate-range', type=float, nargs=2, default=[8.0, 18.0], metavar=('MIN', 'MAX'))
+        parser.add_argument('--behaviour-mix', type=float, nargs=3, default=[0.7, 0.2, 0.1],
+                            metavar=('ON_TIME', 'LATE', 'DEFAULTER'), help="Relative weights of repayment behaviours.")
+
+    def handle(self, *args, **options):
+        config = self._build_config(options)
+        started = time.perf_counter()
+
+        if options['format'] == 'csv':
+            self._write_csv(config, options['output_dir'])
+        elif options['format'] == 'xlsx':
+            self._write_xlsx(config, options['output_dir'])
+        else:
+            self._write_db(config)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Generated {config.customers} customers and {config.loans} loans "
+            f"(seed={config.seed}) in {time.perf_counter() - started:.1f}s."
+        ))
+
+    def _build_config(self, options) -> GenerationConfig:
+        if options['customers'] < 1 or options['loans'] < 0:
+            raise CommandError("--customers must be at least 1 and --loans must not be negative.")
+        for name in ('age_range', 'tenure_range', 'rate_range'):
+            low, high = options[name]
+            if low > high or low <= 0:
+                raise CommandError(f"--{name.replace('_', '-')} must be positive with MIN <= MAX.")
+        if min(options['behaviour_mix']) < 0 or sum(options['behaviour_mix']) <= 0:
+            raise CommandError("--behaviour-mix weights must be non-negative and not all zero.")
+
+        return GenerationConfig(
+            customers=options['customers'],
+            loans=options['loans'],
+            seed=options['seed'],
+            as_of=options['as_of'],
+            age_range=tuple(options['age_range']),
+            salary_median=options['salary_median'],
+            salary_sigma=options['salary_sigma'],
+            tenure_range=tuple(options['tenure_range']),
+            rate_range=tuple(options['rate_range']),
+            behaviour_mix=tuple(options['behaviour_mix']),
+        )
+
+    # --- File output ---
+
+    def _write_csv(self, config, output_dir):
+        os.makedirs(output_dir, exist_ok=True)
+        customer_path = os.path.join(output_dir, 'customer_data.csv')
+        loan_path = os.path.join(output_dir, 'loan_data.csv')
+
+        # Headers are written up front so chunks and loan batches can simply be appended
+        pd.DataFrame(columns=CUSTOMER_COLUMNS).to_csv(customer_path, index=False)
+        pd.DataFrame(columns=LOAN_COLUMNS).to_csv(loan_path, index=False)
+
+        for customers, loan_batches in iter_chunks(config):
+            customers.to_csv(customer_path, mode='a', header=False, index=False)
+            for loans in loan_batches:
+                loans.to_csv(loan_path, mode='a', header=False, index=False, date_format='%Y-%m-%d')
+
+        self.stdout.write(f"Wrote {customer_path} and {loan_path}")
+
+    def _write_xlsx(self, config, output_dir):
+        if max(config.customers, config.loans) > XLSX_MAX_ROWS:
+            raise CommandError(f"XLSX sheets hold at most {XLSX_MAX_ROWS} rows; use --format csv or db.")
+
+        os.makedirs(output_dir, exist_ok=True)
+        customer_frames, loan_frames = [], []
+        for customers, loan_batches in iter_chunks(config):
+            customer_frames.append(customers)
+            loan_frames.extend(loan_batches)
+        customers = pd.concat(customer_frames, ignore_index=True)
+        loans = pd.concat(loan_frames, ignore_index=True) if loan_frames else pd.DataFrame(columns=LOAN_COLUMNS)
+
+        customer_path = os.path.join(output_dir, 'customer_data.xlsx')
+        loan_path = os.path.join(output_dir, 'loan_data.xlsx')
+        customers.to_excel(customer_path, index=False)
+        loans.to_excel(loan_path, index=False)
+        self.stdout.write(f"Wrote {customer_path} and {loan_path}")
+
+    # --- Database output ---
+
+    def _write_db(self, config):
+        if Customer.objects.exists():
+            raise CommandError("The database already contains customers; run `manage.py flush` first.")
+
+        today = np.datetime64(date.today(), 'D')
+        for customers, loan_batches in iter_chunks(config):
+            customer_objects = [
+                Customer(
+                    id=row[0], first_name=row[1], last_name=row[2], age=row[3], phone_number=str(row[4]),
+                    monthly_salary=row[5], approved_limit=row[6],
+                )
+                for row in customers.itertuples(index=False, name=None)
+            ]
+
+            with transaction.atomic():
+                Customer.objects.bulk_create(customer_objects, batch_size=DB_BATCH_SIZE)
+
+                totals = None
+                for loans in loan_batches:
+                    totals = self._insert_loans(loans, today, totals)
+
+                # Apply debt/EMI totals once the chunk's loans (possibly several batches) are all in
+                if totals is not None and len(totals):
+                    customers_by_id = {customer.id: customer for customer in customer_objects}
+                    updated = []
+                    for customer_id, debt_total, emi_total in zip(
+                        totals.index.tolist(), totals['debt'].tolist(), totals['emi'].tolist()
+                    ):
+                        customer = customers_by_id[customer_id]
+                        customer.current_debt = debt_total
+                        customer.total_monthly_emi = emi_total
+                        updated.append(customer)
+                    Customer.objects.bulk_update(
+                        updated, ['current_debt', 'total_monthly_emi'], batch_size=DB_BATCH_SIZE
+                    )
+            self.stdout.write(f"Inserted customers up to ID {customers['Customer ID'].iloc[-1]}")
+
+        # Customers were inserted with explicit IDs, so move the sequence past them for /register
+        with connection.cursor() as cursor:
+            for sql in connection.ops.sequence_reset_sql(no_style(), [Customer]):
+                cursor.execute(sql)
+
+        # Stop the startup ingestion from loading the fixture files on top of this dataset
+        InitialDataIngestion.objects.update_or_create(
+            id=1, defaults={'is_customer_data_ingested': True, 'is_loan_data_ingested': True}
+        )
+
+    def _insert_loans(self, loans, today, totals):
+        """Inserts one loan batch and returns totals (per-customer active debt/EMI) with this batch added."""
+        # Same derived fields as ingest_initial_data: active loans and their estimated outstanding debt
+        start_dates = loans['Date of Approval'].to_numpy().astype('datetime64[D]')
+        end_dates = loans['End Date'].to_numpy().astype('datetime64[D]')
+        is_current = end_dates > today
+        remaining_tenure = loans['Tenure'].to_numpy() - months_between(start_dates, np.full(len(loans), today))
+        payments = loans['Monthly payment'].to_numpy()
+        debt = np.where(is_current & (remaining_tenure > 0), remaining_tenure * payments * 0.9, 0.0)
+
+        loan_objects = [
+            Loan(
+                customer_id=customer_id, loan_amount=amount, tenure=tenure, interest_rate=rate,
+                monthly_installment=payment, emis_paid_on_time=paid, start_date=start, end_date=end,
+                is_current=current,
+            )
+            for customer_id, amount, tenure, rate, payment, paid, start, end, current in zip(
+                loans['Customer ID'].tolist(), loans['Loan Amount'].tolist(), loans['Tenure'].tolist(),
+                loans['Interest Rate'].tolist(), loans['Monthly payment'].tolist(),
+                loans['EMIs paid on Time'].tolist(), start_dates.tolist(), end_dates.tolist(), is_current.tolist(),
+            )
+        ]
+        Loan.objects.bulk_create(loan_objects, batch_size=DB_BATCH_SIZE)
+
+        active = pd.DataFrame({
+            'Customer ID': loans['Customer ID'].to_numpy()[is_current],
+            'debt': debt[is_current],
+            'emi': payments[is_current].astype(float),
+        }).groupby('Customer ID').sum()
+        return active if totals is None else totals.add(active, fill_value=0.0)
@@ -0,0 +1,176 @@
+import numpy as np
+import pandas as pd
+from datetime import date
+
+# Column layouts of customer_data.xlsx / loan_data.xlsx, as read by ingest_initial_data
+CUSTOMER_COLUMNS = ['Customer ID', 'First Name', 'Last Name', 'Age', 'Phone Number', 'Monthly Salary', 'Approved Limit']
+LOAN_COLUMNS = [
+    'Customer ID', 'Loan ID', 'Loan Amount', 'Tenure', 'Interest Rate', 'Monthly payment',
+    'EMIs paid on Time', 'Date of Approval', 'End Date',
+]
+
+# Generation happens in fixed-size customer chunks, each seeded from (seed, chunk index). A chunk's loans
+# are produced in batches of at most CHUNK_LOANS, each seeded from (seed, chunk index, batch index), so
+# memory stays bounded at any loans-per-customer ratio and output depends only on the seed and parameters.
+CHUNK_CUSTOMERS = 100_000
+CHUNK_LOANS = 500_000
+
+FIRST_NAMES = [
+    'Aarav', 'Aditi', 'Akash', 'Ananya', 'Arjun', 'Diya', 'Farhan', 'Gauri', 'Harsh', 'Isha',
+    'Kabir', 'Kavya', 'Meera', 'Nikhil', 'Neha', 'Pranav', 'Priya', 'Rahul', 'Riya', 'Rohan',
+    'Sahil', 'Sanya', 'Tanvi', 'Varun', 'Vikram', 'Zara', 'Aaron', 'Abbey', 'Grace', 'Omar',
+]
+LAST_NAMES = [
+    'Agarwal', 'Bose', 'Chopra', 'Das', 'Desai', 'Gupta', 'Iyer', 'Jain', 'Joshi', 'Kapoor',
+    'Khan', 'Kumar', 'Menon', 'Mehta', 'Nair', 'Patel', 'Rao', 'Reddy', 'Shah', 'Sharma',
+    'Singh', 'Verma', 'Garcia', 'Gonzalez', 'Rodrigues', 'Fernandes', 'Pillai', 'Saxena', 'Thomas', 'Yadav',
+]
+
+# Loan amount as a multiple of monthly salary (lognormal), matching the fixtures' 1–10 lakh range
+LOAN_TO_SALARY_MEDIAN = 4.0
+LOAN_TO_SALARY_SIGMA = 0.6
+MIN_LOAN_AMOUNT = 50000
+
+# Repayment behaviours, in the order of GenerationConfig.behaviour_mix
+ON_TIME, OCCASIONALLY_LATE, DEFAULTER = 0, 1, 2
+
+class GenerationConfig:
+    """Parameters of a synthetic dataset. Identical configs always produce identical data."""
+
+    def __init__(self, customers: int, loans: int, seed: int = 0, as_of: date = date(2025, 1, 1),
+                 age_range=(20, 70), salary_median: int = 150000, salary_sigma: float = 0.5,
+                 tenure_range=(3, 180), rate_range=(8.0, 18.0), behaviour_mix=(0.7, 0.2, 0.1),
+                 history_years: int = 15):
+        self.customers = customers
+        self.loans = loans
+        self.seed = seed
+        self.as_of = as_of
+        self.age_range = age_range
+        self.salary_median = salary_median
+        self.salary_sigma = salary_sigma
+        self.tenure_range = tenure_range
+        self.rate_range = rate_range
+        self.behaviour_mix = np.asarray(behaviour_mix, dtype=float) / sum(behaviour_mix)
+        self.history_years = history_years
+
+def _add_months(days: np.ndarray, months: np.ndarray) -> np.ndarray:
+    """datetime64[D] + months, clipping to month end like relativedelta."""
+    month_start = days.astype('datetime64[M]')
+    day_of_month = (days - month_start.astype('datetime64[D]')).astype(int)
+    target = month_start + months.astype('timedelta64[M]')
+    days_in_target = ((target + 1).astype('datetime64[D]') - target.astype('datetime64[D]')).astype(int)
+    return target.astype('datetime64[D]') + np.minimum(day_of_month, days_in_target - 1).astype('timedelta64[D]')
+
+def months_between(start: np.ndarray, end: np.ndarray) -> np.ndarray:
+    """Whole months from start to end, matching relativedelta(end, start).years * 12 + .months."""
+    start_month = start.astype('datetime64[M]')
+    end_month = end.astype('datetime64[M]')
+    months = (end_month - start_month).astype(int)
+    start_day = (start - start_month.astype('datetime64[D]')).astype(int)
+    end_day = (end - end_month.astype('datetime64[D]')).astype(int)
+    days_in_end_month = ((end_month + 1).astype('datetime64[D]') - end_month.astype('datetime64[D]')).astype(int)
+    # relativedelta only counts the last month once start + months (clipped to month end) has been reached
+    return months - (np.minimum(start_day, days_in_end_month - 1) > end_day)
+
+def _monthly_installments(amounts: np.ndarray, rates: np.ndarray, tenures: np.ndarray) -> np.ndarray:
+    """Vectorized calculate_monthly_installment (rates are always > 0 here)."""
+    monthly_rate = (rates / 12) / 100
+    growth = (1 + monthly_rate) ** tenures
+    return amounts * ((monthly_rate * growth) / (growth - 1))
+
+def generate_customers(config: GenerationConfig, chunk_index: int) -> tuple:
+    """Returns (customers_df, loan_weights) for one chunk of customers."""
+    rng = np.random.default_rng([config.seed, chunk_index])
+
+    first_id = chunk_index * CHUNK_CUSTOMERS + 1
+    last_id = min(first_id + CHUNK_CUSTOMERS - 1, config.customers)
+    customer_ids = np.arange(first_id, last_id + 1, dtype=np.int64)
+    n_customers = len(customer_ids)
+
+    salaries = rng.lognormal(np.log(config.salary_median), config.salary_sigma, n_customers)
+    salaries = (np.clip(np.round(salaries / 1000), 10, 5000) * 1000).astype(np.int64)
+    # Same arithmetic as calculate_approved_limit (both round half to even)
+    approved_limits = (np.round(36 * salaries / 100000) * 100000).astype(np.int64)
+
+    # Unique 10-digit numbers starting with 6-9: an affine bijection of the customer ID
+    phone_space = 4_000_000_000
+    phone_multiplier = 2_654_435_761 # odd and not divisible by 5, so coprime with the space
+    phone_offset = np.random.default_rng(config.seed).integers(phone_space)
+    phones = 6_000_000_000 + (customer_ids * phone_multiplier + phone_offset) % phone_space
+
+    customers = pd.DataFrame({
+        'Customer ID': customer_ids,
+        'First Name': np.asarray(FIRST_NAMES, dtype=object)[rng.integers(len(FIRST_NAMES), size=n_customers)],
+        'Last Name': np.asarray(LAST_NAMES, dtype=object)[rng.integers(len(LAST_NAMES), size=n_customers)],
+        'Age': rng.integers(config.age_range[0], config.age_range[1] + 1, n_customers),
+        'Phone Number': phones,
+        'Monthly Salary': salaries,
+        'Approved Limit': approved_limits,
+    }, columns=CUSTOMER_COLUMNS)
+
+    # Skews how many loans each customer holds
+    weights = rng.gamma(shape=1.5, size=n_customers)
+    return customers, weights / weights.sum()
+
+def generate_loans(config: GenerationConfig, chunk_index: int, batch_index: int, customers: pd.DataFrame,
+                   loan_weights: np.ndarray, first_loan: int, n_loans: int) -> pd.DataFrame:
+    """Returns one batch of n_loans loans owned by the chunk's customers, with IDs from first_loan + 1."""
+    rng = np.random.default_rng([config.seed, chunk_index, batch_index])
+
+    owner = rng.choice(len(customers), size=n_loans, p=loan_weights)
+    customer_ids = customers['Customer ID'].to_numpy()
+    salaries = customers['Monthly Salary'].to_numpy()
+
+    tenures = rng.integers(config.tenure_range[0], config.tenure_range[1] + 1, n_loans)
+    rates = np.round(rng.uniform(config.rate_range[0], config.rate_range[1], n_loans), 2)
+    multiples = rng.lognormal(np.log(LOAN_TO_SALARY_MEDIAN), LOAN_TO_SALARY_SIGMA, n_loans)
+    amounts = np.maximum(np.round(salaries[owner] * multiples / 10000) * 10000, MIN_LOAN_AMOUNT)
+
+    as_of = np.datetime64(config.as_of, 'D')
+    history_days = int(config.history_years * 365.25)
+    start_dates = as_of - rng.integers(0, history_days, n_loans).astype('timedelta64[D]')
+    end_dates = _add_months(start_dates, tenures)
+
+    # EMIs due so far, then what was actually paid on time for each repayment behaviour
+    elapsed = np.clip(months_between(start_dates, np.full(n_loans, as_of)), 0, tenures)
+    behaviours = rng.choice(3, size=n_loans, p=config.behaviour_mix)
+    missed = rng.binomial(elapsed, 0.1)
+    defaulted = np.floor(elapsed * rng.uniform(0.1, 0.5, n_loans)).astype(np.int64)
+    paid_on_time = np.select(
+        [behaviours == ON_TIME, behaviours == OCCASIONALLY_LATE],
+        [elapsed, elapsed - missed],
+        defaulted,
+    )
+
+    return pd.DataFrame({
+        'Customer ID': customer_ids[owner],
+        'Loan ID': np.arange(first_loan + 1, first_loan + n_loans + 1, dtype=np.int64),
+        'Loan Amount': amounts.astype(np.int64),
+        'Tenure': tenures,
+        'Interest Rate': rates,
+        'Monthly payment': np.round(_monthly_installments(amounts, rates, tenures)).astype(np.int64),
+        'EMIs paid on Time': paid_on_time,
+        'Date of Approval': start_dates,
+        'End Date': end_dates,
+    }, columns=LOAN_COLUMNS)
+
+def _iter_loan_batches(config: GenerationConfig, chunk_index: int, customers: pd.DataFrame, loan_weights: np.ndarray):
+    # This chunk's exact share of the total loans, proportional to its customers
+    first_id = customers['Customer ID'].iloc[0]
+    last_id = customers['Customer ID'].iloc[-1]
+    first_loan = config.loans * (first_id - 1) // config.customers
+    end_loan = config.loans * last_id // config.customers
+
+    for batch_index, batch_start in enumerate(range(first_loan, end_loan, CHUNK_LOANS)):
+        n_loans = min(CHUNK_LOANS, end_loan - batch_start)
+        yield generate_loans(config, chunk_index, batch_index, customers, loan_weights, batch_start, n_loans)
+
+def iter_chunks(config: GenerationConfig):
+    """
+    Yields (customers_df, loan_batches) for every chunk, in order.
+    loan_batches lazily yields DataFrames of at most CHUNK_LOANS loans; consume it before the next chunk.
+    """
+    n_chunks = -(-config.customers // CHUNK_CUSTOMERS)
+    for chunk_index in range(n_chunks):
+        customers, loan_weights = generate_customers(config, chunk_index)
+        yield customers, _iter_loan_batches(config, chunk_index, customers, loan_weights)